@@ -1,14 +1,44 @@
 import os
 import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from tqdm import tqdm
 from urllib.parse import urlparse
 from datetime import datetime
 from shared.webpage_downloader import download_webpage
+from shared.http_session import MAX_DOWNLOAD_WORKERS
 from shared.utils import sanitize_filename, get_pages_folder
 
+def download_category_firstpage(url, pages_folder, overwrite=False, debug=False):
+    """
+    Downloads the first page of a single category into the pages folder.
+
+    :param url: Absolute URL of the category.
+    :param pages_folder: Absolute path of the folder for saving the downloaded page.
+    :param overwrite: Boolean indicating whether to overwrite existing files.
+    :param debug: Boolean indicating whether to enable debug logging.
+    :return: Absolute path to the downloaded file, or None if the download failed.
+    """
+    try:
+        # Parse URL to create a valid filename
+        parsed_url = urlparse(url)
+        filename = (parsed_url.path+parsed_url.query).strip("/").replace('/', '_') + '.html'
+        logging.debug("Original filename: %s", filename)
+        sanitized_filename = sanitize_filename(filename)
+        logging.debug("Sanitized filename: %s", sanitized_filename)
+        file_path = os.path.join(pages_folder, sanitized_filename)
+
+        # Download the webpage
+        if download_webpage(url, file_path, overwrite=overwrite, debug=debug):
+            return file_path
+        return None
+
+    except Exception as e:
+        logging.error(f"Error downloading category first page {url}: {e}", exc_info=True)
+        return None
+
 def download_category_firstpages(category_urls, root_folder, overwrite=False, debug=False):
     """
-    Downloads the first pages of categories and displays a progress bar.
+    Downloads the first pages of categories concurrently and displays a progress bar.
 
     :param category_urls: Set of absolute URLs of categories.
     :param root_folder: Root folder for saving the downloaded pages.
@@ -17,36 +47,27 @@ def download_category_firstpages(category_urls, root_folder, overwrite=False, de
     :return: List of paths to the downloaded files, relative to the root folder.
     """
     try:
-        downloaded_files = []
-        pages_folder = get_pages_folder(root_folder)
-
-        # Progress bar setup
-        with tqdm(total=len(category_urls), desc="Downloading category first pages") as pbar:
-            for url in category_urls:
-                try:
-                    # Parse URL to create a valid filename
-                    parsed_url = urlparse(url)
-                    filename = (parsed_url.path+parsed_url.query).strip("/").replace('/', '_') + '.html'
-                    logging.debug(f"Original filename: {filename}")
-                    sanitized_filename = sanitize_filename(filename)
-                    logging.debug(f"Sanitized filename: {sanitized_filename}")
-                    file_path = os.path.join(pages_folder, sanitized_filename)
-
-                    # Download the webpage
-                    if download_webpage(url, file_path, overwrite=overwrite, debug=debug):
-                        # Add the absolute path to the list of downloaded files only if download is successful
-                        downloaded_files.append(os.path.abspath(file_path))
+        downloaded_files = set()
+        # Resolve the folder once so every page path is already absolute
+        pages_folder = os.path.abspath(get_pages_folder(root_folder))
+
+        with ThreadPoolExecutor(max_workers=MAX_DOWNLOAD_WORKERS) as executor:
+            futures = [executor.submit(download_category_firstpage, url, pages_folder, overwrite, debug) for url in category_urls]
+
+            # Progress bar setup
+            with tqdm(total=len(futures), desc="Downloading category first pages") as pbar:
+                for future in as_completed(futures):
+                    file_path = future.result()
+                    # Add the absolute path to the downloaded files only if download is successful
+                    if file_path:
+                        downloaded_files.add(file_path)
 
                     # Update progress bar
                     pbar.update(1)
 
-                except Exception as e:
-                    logging.error(f"Error downloading category first page {url}: {e}", exc_info=True)
-                    continue
-
-        # Ensure the returned list is sorted and unique
-        unique_sorted_files = sorted(set(downloaded_files))
-        logging.debug(f"Unique sorted downloaded category first pages: {len(unique_sorted_files)}")
+        # Ensure the returned list is sorted; the set already keeps it unique
+        unique_sorted_files = sorted(downloaded_files)
+        logging.debug("Unique sorted downloaded category first pages: %s", len(unique_sorted_files))
         return unique_sorted_files
     except Exception as e:
         logging.error(f"Error in download_category_firstpages: {e}", exc_info=True)
@@ -1,54 +1,75 @@
 # category_pages_downloader.py
 import os
 import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from tqdm import tqdm
 from urllib.parse import urlparse
 from shared.webpage_downloader import download_webpage
+from shared.http_session import MAX_DOWNLOAD_WORKERS
 from shared.utils import sanitize_filename, get_pages_folder
 
+def download_category_page(url, pages_folder, overwrite=False, debug=False):
+    """
+    Downloads a single category page into the pages folder.
+
+    :param url: Absolute URL of the category page.
+    :param pages_folder: Absolute path of the folder for saving the downloaded page.
+    :param overwrite: Boolean indicating whether to overwrite existing files.
+    :param debug: Boolean indicating whether to enable debug logging.
+    :return: Absolute path to the downloaded file, or None if the download failed.
+    """
+    try:
+        # Parse URL to create a valid filename
+        parsed_url = urlparse(url)
+        filename = (parsed_url.path+parsed_url.query).strip("/").replace('/', '_') + '.html'
+        logging.debug("Original filename: %s", filename)
+        sanitized_filename = sanitize_filename(filename)
+        logging.debug("Sanitized filename: %s", sanitized_filename)
+        file_path = os.path.join(pages_folder, sanitized_filename)
+
+        logging.debug("Downloading webpage from URL: %s to filepath: %s", url, file_path)
+        # Download the webpage
+        if download_webpage(url, file_path, overwrite=overwrite, debug=debug):
+            return file_path
+        return None
+
+    except Exception as e:
+        logging.error(f"Error downloading category page {url}: {e}", exc_info=True)
+        return None
+
 def download_category_pages(category_page_links, root_folder, overwrite=False, debug=False):
     """
-    Downloads all category pages and displays a progress bar.
+    Downloads all category pages concurrently and displays a progress bar.
 
-    :param category_first_page_paths: List of file paths to category first pages.
+    :param category_page_links: Set of absolute URLs of category pages.
     :param root_folder: Root folder for saving the downloaded pages.
     :param overwrite: Boolean indicating whether to overwrite existing files.
     :param debug: Boolean indicating whether to enable debug logging.
     :return: List of paths to the downloaded files, relative to the root folder.
     """
     try:
-        downloaded_files = []
-        pages_folder = get_pages_folder(root_folder)
-
-        # Progress bar setup
-        with tqdm(total=len(category_page_links), desc="Downloading all category pages") as pbar:
-            for url in category_page_links:
-                try:
-                    # Parse URL to create a valid filename
-                    parsed_url = urlparse(url)
-                    filename = (parsed_url.path+parsed_url.query).strip("/").replace('/', '_') + '.html'
-                    logging.debug(f"Original filename: {filename}")
-                    sanitized_filename = sanitize_filename(filename)
-                    logging.debug(f"Sanitized filename: {sanitized_filename}")
-                    file_path = os.path.join(pages_folder, sanitized_filename)
-
-                    logging.debug(f"Downloading webpage from URL: {url} to filepath: {file_path}")
-                    # Download the webpage
-                    if download_webpage(url, file_path, overwrite=overwrite, debug=debug):
-                        # Add the absolute path to the list of downloaded files only if download is successful
-                        downloaded_files.append(os.path.abspath(file_path))
+        downloaded_files = set()
+        # Resolve the folder once so every page path is already absolute
+        pages_folder = os.path.abspath(get_pages_folder(root_folder))
+
+        with ThreadPoolExecutor(max_workers=MAX_DOWNLOAD_WORKERS) as executor:
+            futures = [executor.submit(download_category_page, url, pages_folder, overwrite, debug) for url in category_page_links]
+
+            # Progress bar setup
+            with tqdm(total=len(futures), desc="Downloading all category pages") as pbar:
+                for future in as_completed(futures):
+                    file_path = future.result()
+                    # Add the absolute path to the downloaded files only if download is successful
+                    if file_path:
+                        downloaded_files.add(file_path)
 
                     # Update progress bar
                     pbar.update(1)
 
-                except Exception as e:
-                    logging.error(f"Error downloading category page {url}: {e}", exc_info=True)
-                    continue
-
-        # Ensure the returned list is sorted and unique
-        unique_sorted_files = sorted(set(downloaded_files))
-        logging.debug(f"Unique sorted downloaded category pages: {len(unique_sorted_files)}")
+        # Ensure the returned list is sorted; the set already keeps it unique
+        unique_sorted_files = sorted(downloaded_files)
+        logging.debug("Unique sorted downloaded category pages: %s", len(unique_sorted_files))
         return unique_sorted_files
     except Exception as e:
         logging.error(f"Error in download_category_pages: {e}", exc_info=True)
-        return []
\ No newline at end of file
+        return []
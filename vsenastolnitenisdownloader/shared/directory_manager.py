@@ -17,8 +17,7 @@ def ensure_directories(root_folder):
 
         # Create the required directories if they don't exist
         for folder in [full_day_folder, pages_folder, products_folder, photos_folder]:
-            if not os.path.exists(folder):
-                os.makedirs(folder)
-                logging.debug(f"Created folder: {folder}")
+            os.makedirs(folder, exist_ok=True)
+            logging.debug("Ensured folder: %s", folder)
     except Exception as e:
         logging.error(f"Error ensuring directories: {e}", exc_info=True)
\ No newline at end of file
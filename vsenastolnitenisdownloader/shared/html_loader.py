@@ -3,20 +3,22 @@ import os
 import logging
 from bs4 import BeautifulSoup
 
-def load_html_as_dom_tree(filepath):
+def load_html_as_dom_tree(filepath, parse_only=None):
     """
     Loads a file from filepath as an HTML DOM tree.
 
     :param filepath: Path to the HTML file.
+    :param parse_only: Optional SoupStrainer restricting which tags are kept in the tree.
     :return: BeautifulSoup object containing the HTML DOM representation.
     """
     try:
         if not os.path.exists(filepath):
             logging.error(f"File does not exist: {filepath}")
             return None
-        with open(filepath, 'r', encoding='utf-8') as file:
+        # Read raw bytes; pages are stored as downloaded, so the parser detects their encoding
+        with open(filepath, 'rb') as file:
             content = file.read()
-        dom_tree = BeautifulSoup(content, 'lxml')
+        dom_tree = BeautifulSoup(content, 'lxml', parse_only=parse_only)
         return dom_tree
     except Exception as e:
         logging.error(f"Error loading HTML file {filepath}: {e}", exc_info=True)
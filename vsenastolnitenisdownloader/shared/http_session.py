@@ -0,0 +1,28 @@
+# http_session.py
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Number of concurrent downloads; the connection pool is sized to match
+MAX_DOWNLOAD_WORKERS = 16
+
+# (connect, read) timeout in seconds for every request made through the session
+REQUEST_TIMEOUT = (5, 30)
+
+def create_session(pool_size=MAX_DOWNLOAD_WORKERS):
+    """
+    Creates a requests session that keeps connections alive between downloads.
+
+    :param pool_size: Number of connections kept open per host.
+    :return: requests.Session with a pooled, retrying HTTPAdapter mounted for http and https.
+    """
+    session = requests.Session()
+    # Retry dropped connections on a pooled socket instead of failing the download
+    retries = Retry(total=3, backoff_factor=0.2)
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retries)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+# Shared by all downloaders so pages and images reuse the same connections
+SESSION = create_session()
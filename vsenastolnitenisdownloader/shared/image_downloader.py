@@ -1,6 +1,6 @@
 import os
 import logging
-import requests
+from shared.http_session import SESSION, REQUEST_TIMEOUT
 from shared.utils import sanitize_filename  # Ensure updated import
 
 def download_image(url, filepath, overwrite=False, debug=False):
@@ -10,28 +10,33 @@ def download_image(url, filepath, overwrite=False, debug=False):
         # Extract the directory and filename from the filepath
         directory, filename = os.path.split(filepath)
 
-        # Sanitize the filename
-        sanitized_filename = sanitize_filename(filename).split("%")[0]
+        # Sanitize the filename; callers build names from the whole URL, so nothing is cut off
+        sanitized_filename = sanitize_filename(filename)
 
         # Reconstruct the sanitized filepath
         sanitized_filepath = os.path.join(directory, sanitized_filename)
-        logging.debug(f"Sanitized filepath: {sanitized_filepath}")
+        logging.debug("Sanitized filepath: %s", sanitized_filepath)
 
         # Check if file already exists
         if not overwrite and os.path.exists(sanitized_filepath):
-            logging.debug(f"File already exists and overwrite is not set: {sanitized_filepath}")
-            return
+            logging.debug("File already exists and overwrite is not set: %s", sanitized_filepath)
+            return True
 
-        # Download the image
-        logging.debug(f"Downloading image from URL: {url} to filepath: {sanitized_filepath}")
-        response = requests.get(url)
-        #response.raise_for_status()  # Raise an HTTPError for bad responses
+        # Download the image, streaming the body straight to disk instead of buffering it whole
+        logging.debug("Downloading image from URL: %s to filepath: %s", url, sanitized_filepath)
+        with SESSION.get(url, stream=True, timeout=REQUEST_TIMEOUT) as response:
+            response.raise_for_status()  # Raise an HTTPError for bad responses
 
-        # Write the content to a file
-        with open(sanitized_filepath, 'wb') as file:
-            file.write(response.content)
-        
+            # Write the content to a .part file and move it into place only once it is complete,
+            # so an interrupted download is not skipped as "already exists" on the next run
+            temp_filepath = sanitized_filepath + '.part'
+            with open(temp_filepath, 'wb') as file:
+                for chunk in response.iter_content(chunk_size=64 * 1024):
+                    file.write(chunk)
+            os.replace(temp_filepath, sanitized_filepath)
+
+        return True
 
     except Exception as e:
         logging.error(f"Error downloading {url} to {sanitized_filepath}: {e}", exc_info=True)
-        
\ No newline at end of file
+        return False
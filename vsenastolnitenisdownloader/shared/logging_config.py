@@ -3,12 +3,23 @@ import colorlog
 import json
 import os
 import sys
+from functools import lru_cache
+
+@lru_cache(maxsize=None)
+def load_color_config(config_path):
+    """
+    Loads the log color configuration, reading the JSON file only once per path.
+
+    :param config_path: Path to the log_colors.json file.
+    :return: Dictionary mapping log level names to colors.
+    """
+    with open(config_path, 'r') as f:
+        return json.load(f)
 
 def setup_logging(debug=False, log_file="logs/logfile.log"):
     # Load color configuration from the JSON file
     try:
-        with open(os.path.join(os.path.dirname(sys.argv[0]), 'shared/log_colors.json'), 'r') as f:
-            color_config = json.load(f)
+        color_config = load_color_config(os.path.join(os.path.dirname(sys.argv[0]), 'shared/log_colors.json'))
     except Exception as e:
         logging.error(f"Failed to load color configuration: {e}", exc_info=True)
         raise
@@ -49,4 +60,4 @@ def setup_logging(debug=False, log_file="logs/logfile.log"):
     root_logger.addHandler(console_handler)
     root_logger.addHandler(file_handler)
 
-    logging.debug(f"Logging setup complete. Log file: {log_file}")
\ No newline at end of file
+    logging.debug("Logging setup complete. Log file: %s", log_file)
\ No newline at end of file
@@ -1,12 +1,12 @@
 import os
 import logging
-from datetime import datetime
 from shared.webpage_downloader import download_webpage
+from shared.utils import get_full_day_folder
 
 def download_main_page(root_folder,MAIN_URL,MAIN_PAGE_FILENAME, overwrite=False):
     try:
-        current_date = datetime.now().strftime("%d.%m.%Y")
-        full_day_folder = os.path.join(root_folder, f"Full_{current_date}")
+        # Use the run's date from shared.utils so the page lands in the same folder as everything else
+        full_day_folder = get_full_day_folder(root_folder)
         main_page_path = os.path.join(full_day_folder, MAIN_PAGE_FILENAME)
 
         logging.info(f"Downloading main page from URL: {MAIN_URL}")
@@ -0,0 +1,43 @@
+# process_pool.py
+import logging
+import multiprocessing
+from contextlib import contextmanager
+from concurrent.futures import ProcessPoolExecutor
+from logging.handlers import QueueHandler, QueueListener
+
+def init_worker_logging(log_queue, level):
+    """
+    Worker process initializer that sends every log record to the main process.
+
+    :param log_queue: Queue read by the QueueListener running in the main process.
+    :param level: Log level of the main process's root logger.
+    """
+    root_logger = logging.getLogger()
+
+    # Drop handlers inherited through fork; the main process's handlers write the records
+    for handler in root_logger.handlers[:]:
+        root_logger.removeHandler(handler)
+
+    root_logger.setLevel(level)
+    root_logger.addHandler(QueueHandler(log_queue))
+
+@contextmanager
+def create_process_pool():
+    """
+    Creates a ProcessPoolExecutor whose workers log through the main process.
+
+    Worker processes started with spawn (the default on Windows) do not run setup_logging,
+    so their records are forwarded over a queue to the handlers of the main process's root logger.
+
+    :return: ProcessPoolExecutor with one worker per core, shut down on exit from the with block.
+    """
+    root_logger = logging.getLogger()
+    log_queue = multiprocessing.Queue()
+    listener = QueueListener(log_queue, *root_logger.handlers, respect_handler_level=True)
+    listener.start()
+    try:
+        with ProcessPoolExecutor(initializer=init_worker_logging, initargs=(log_queue, root_logger.level)) as executor:
+            yield executor
+    finally:
+        # Workers have exited here, so every record they sent is already in the queue
+        listener.stop()
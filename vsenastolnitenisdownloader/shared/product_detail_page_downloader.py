@@ -1,13 +1,44 @@
 import os
 import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from tqdm import tqdm
 from urllib.parse import urlparse
 from shared.webpage_downloader import download_webpage
+from shared.http_session import MAX_DOWNLOAD_WORKERS
 from shared.utils import get_products_folder
 
+def download_product_detail_page(url, products_folder, overwrite=False, debug=False):
+    """
+    Downloads a single product detail page into the products folder.
+
+    :param url: Absolute URL of the product detail page.
+    :param products_folder: Absolute path of the folder for saving the downloaded page.
+    :param overwrite: Boolean indicating whether to overwrite existing files.
+    :param debug: Boolean indicating whether to enable debug logging.
+    :return: Absolute path to the downloaded file, or None if the download failed.
+    """
+    try:
+        logging.debug("Processing URL: %s", url)
+
+        # Parse URL to create a valid filename
+        parsed_url = urlparse(url)
+        filename = (parsed_url.path+parsed_url.query).strip("/").replace('/', '_') + '.html'
+        file_path = os.path.join(products_folder, filename)
+
+        logging.debug("Downloading webpage from URL: %s to filepath: %s", url, file_path)
+
+        # Download the webpage
+        if download_webpage(url, file_path, overwrite=overwrite, debug=debug):
+            return file_path
+        return None
+
+    except Exception as e:
+        logging.error(f"Error downloading product detail page {url}: {e}", exc_info=True)
+        return None
+
 def download_product_detail_pages(product_detail_urls, root_folder, overwrite=False, debug=False):
     """
-    Downloads all product detail pages and displays a progress bar.
+    Downloads all product detail pages concurrently and displays a progress bar.
 
     :param product_detail_urls: Set of absolute URLs of product detail pages.
     :param root_folder: Root folder for saving the downloaded pages.
@@ -15,35 +46,25 @@ def download_product_detail_pages(product_detail_urls, root_folder, overwrite=Fa
     :param debug: Boolean indicating whether to enable debug logging.
     :return: List of paths to the downloaded files, relative to the root folder.
     """
-    downloaded_files = []
-    products_folder = get_products_folder(root_folder)
+    downloaded_files = set()
+    # Resolve the folder once so every page path is already absolute
+    products_folder = os.path.abspath(get_products_folder(root_folder))
 
-    # Progress bar setup
-    with tqdm(total=len(product_detail_urls), desc="Downloading product detail pages") as pbar:
-        for url in product_detail_urls:
-            try:
-                logging.debug(f"Processing URL: {url}")
+    with ThreadPoolExecutor(max_workers=MAX_DOWNLOAD_WORKERS) as executor:
+        futures = [executor.submit(download_product_detail_page, url, products_folder, overwrite, debug) for url in product_detail_urls]
 
-                # Parse URL to create a valid filename
-                parsed_url = urlparse(url)
-                filename = (parsed_url.path+parsed_url.query).strip("/").replace('/', '_') + '.html'
-                file_path = os.path.join(products_folder, filename)
-
-                logging.debug(f"Downloading webpage from URL: {url} to filepath: {file_path}")
-
-                # Download the webpage
-                if download_webpage(url, file_path, overwrite=overwrite, debug=debug):
-                    # Add the absolute path to the list of downloaded files only if download is successful
-                    downloaded_files.append(os.path.abspath(file_path))
+        # Progress bar setup
+        with tqdm(total=len(futures), desc="Downloading product detail pages") as pbar:
+            for future in as_completed(futures):
+                file_path = future.result()
+                # Add the absolute path to the downloaded files only if download is successful
+                if file_path:
+                    downloaded_files.add(file_path)
 
                 # Update progress bar
                 pbar.update(1)
 
-            except Exception as e:
-                logging.error(f"Error downloading product detail page {url}: {e}", exc_info=True)
-                continue
-
-    # Ensure the returned list is sorted and unique
-    unique_sorted_files = sorted(set(downloaded_files))
-    logging.debug(f"Unique sorted downloaded product detail pages: {len(unique_sorted_files)}")
-    return unique_sorted_files
\ No newline at end of file
+    # Ensure the returned list is sorted; the set already keeps it unique
+    unique_sorted_files = sorted(downloaded_files)
+    logging.debug("Unique sorted downloaded product detail pages: %s", len(unique_sorted_files))
+    return unique_sorted_files
@@ -1,29 +1,68 @@
 import os
+import hashlib
 import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from tqdm import tqdm
+from urllib.parse import urlparse
 from shared.utils import get_photos_folder
 from shared.utils import sanitize_filename
 from shared.image_downloader import download_image
+from shared.http_session import MAX_DOWNLOAD_WORKERS
+
+def get_image_filename(link):
+    """
+    Builds a file name for an image that depends only on its URL: the URL's base name plus
+    a short digest of the whole URL, so images with the same base name on different paths
+    (or with different query strings) never share a file, in any step or run.
+
+    :param link: Absolute URL of the image.
+    :return: Sanitized file name, with the URL's extension kept at the end.
+    """
+    name, extension = os.path.splitext(os.path.basename(urlparse(link).path))
+    digest = hashlib.sha1(link.encode('utf-8')).hexdigest()[:12]
+    return sanitize_filename(f"{name}_{digest}{extension}")
+
+def download_unique_images(links, root_folder, desc, overwrite=False, debug=False):
+    """
+    Downloads every distinct image link once, using a thread pool.
+
+    :param links: Image URLs; repeated URLs (e.g. images shared by several products) are downloaded once
+                  and all products referencing them get the same file.
+    :param root_folder: Root folder for saving the downloaded images.
+    :param desc: Progress bar description.
+    :param overwrite: Boolean indicating whether to overwrite existing files.
+    :param debug: Boolean indicating whether to enable debug logging.
+    :return: Dictionary mapping each successfully downloaded URL to its file path.
+    """
+    photos_folder = get_photos_folder(root_folder)
+    # Deduplicate by URL first; each distinct URL has its own file name
+    filepaths = {link: os.path.join(photos_folder, get_image_filename(link)) for link in dict.fromkeys(links)}
+
+    with ThreadPoolExecutor(max_workers=MAX_DOWNLOAD_WORKERS) as executor:
+        futures = {link: executor.submit(download_image, link, filepath, overwrite, debug) for link, filepath in filepaths.items()}
+        with tqdm(total=len(futures), desc=desc) as pbar:
+            for future in as_completed(futures.values()):
+                pbar.update(1)
+
+    return {link: filepath for link, filepath in filepaths.items() if futures[link].result()}
 
 def download_product_main_image(products, root_folder, overwrite=False, debug=False):
     try:
-        photos_folder = get_photos_folder(root_folder)
-        for product in tqdm(products, desc="Downloading main product images"):
-            if product.main_photo_link:
-                filename = os.path.join(photos_folder, sanitize_filename(product.main_photo_link))
-                if download_image(product.main_photo_link, filename, overwrite, debug):
-                    product.main_photo_filepath = filename
+        main_photo_links = [product.main_photo_link for product in products if product.main_photo_link]
+        downloaded = download_unique_images(main_photo_links, root_folder, "Downloading main product images", overwrite, debug)
+        for product in products:
+            if product.main_photo_link in downloaded:
+                product.main_photo_filepath = downloaded[product.main_photo_link]
     except Exception as e:
         logging.error(f"Error downloading main product images: {e}", exc_info=True)
 
 def download_product_gallery_images(products, root_folder, overwrite=False, debug=False):
     try:
-        photos_folder = get_photos_folder(root_folder)
-        for product in tqdm(products, desc="Downloading product gallery images"):
-            for link in product.photogallery_links:
-                filename = os.path.join(photos_folder, sanitize_filename(link))
-                if download_image(link, filename, overwrite, debug):
-                    product.photogallery_filepaths.append(filename)
+        gallery_links = [link for product in products for link in product.photogallery_links]
+        downloaded = download_unique_images(gallery_links, root_folder, "Downloading product gallery images", overwrite, debug)
+        # Each gallery keeps its link order
+        for product in products:
+            product.photogallery_filepaths.extend(downloaded[link] for link in product.photogallery_links if link in downloaded)
     except Exception as e:
         logging.error(f"Error downloading product gallery images: {e}", exc_info=True)
 
@@ -31,7 +70,6 @@ def get_image_folder(product, root_folder, image_type):
     photo_folder = get_photos_folder(root_folder)
     product_name_sanitized = sanitize_filename(product.name)
     folder = os.path.join(photo_folder, product_name_sanitized, image_type)
-    if not os.path.exists(folder):
-        os.makedirs(folder)
-        logging.debug(f"Created folder: {folder}")
-    return folder
\ No newline at end of file
+    os.makedirs(folder, exist_ok=True)
+    logging.debug("Ensured folder: %s", folder)
+    return folder
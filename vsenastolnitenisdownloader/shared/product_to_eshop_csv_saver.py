@@ -1,25 +1,29 @@
 import csv
 import logging
-from tqdm import tqdm
 import json
 
+# Built once: json.dumps with non-default options constructs a new encoder on every call
+VARIANT_JSON_ENCODER = json.JSONEncoder(ensure_ascii=False)
+
 def export_to_csv(csv_output_path,products):
-    with open(csv_output_path, 'w', newline='', encoding='utf-8') as csvfile:
+    # Build all product rows up front so they can be written with a single writerows call
+    rows = [
+        [
+            product.name,
+            product.short_description,
+            product.description,
+            product.main_photo_filepath,
+            '|'.join(product.photogallery_filepaths),
+            '|'.join([VARIANT_JSON_ENCODER.encode({"key_value_pairs": variant.key_value_pairs,"current_price": variant.current_price,"basic_price": variant.basic_price,"stock_status": variant.stock_status}) for variant in product.variants]),
+            product.url
+        ]
+        for product in products
+    ]
+    with open(csv_output_path, 'w', newline='', encoding='utf-8', buffering=1 << 20) as csvfile:
         csvwriter = csv.writer(csvfile)
         # Write the header
         csvwriter.writerow(['Name', 'Short Description', 'Description',  'Main Photo Filepath', 'Gallery Filepaths', 'Variants','URL'])
         # Write product data
-        with tqdm(total=len(products), desc="Exporting to csv") as pbar:
-            for product in products:
-                csvwriter.writerow([
-                    product.name,
-                    product.short_description,
-                    product.description,
-                    product.main_photo_filepath,
-                    '|'.join(product.photogallery_filepaths),
-                    '|'.join([json.dumps({"key_value_pairs": variant.key_value_pairs,"current_price": variant.current_price,"basic_price": variant.basic_price,"stock_status": variant.stock_status},ensure_ascii=False) for variant in product.variants]),
-                    product.url
-                ])
-                pbar.update(1)
+        csvwriter.writerows(rows)
 
     logging.info(f"CSV output generated at: {csv_output_path}")
@@ -1,4 +1,5 @@
 import re
+from functools import lru_cache
 from urllib.parse import quote
 import html
 from datetime import datetime
@@ -7,12 +8,16 @@ import os
 import sys  # Import sys to access sys.argv
 import logging
 
+# Characters not allowed in filenames ('/' is replaced with '_' before matching)
+ILLEGAL_FILENAME_CHARS = re.compile(r'[<>:"|?*]')
+
+@lru_cache(maxsize=65536)
 def sanitize_filename(filename):
     """
     Sanitize the filename by replacing illegal characters with their URL-encoded equivalents.
     """
     # Replace illegal characters with URL-encoded equivalents
-    sanitized = re.sub(r'[<>:"/\|?*/]', lambda match: quote(match.group(0)), filename.replace("/","_"))
+    sanitized = ILLEGAL_FILENAME_CHARS.sub(lambda match: quote(match.group(0)), filename.replace("/","_"))
     return sanitized
     
 
@@ -30,7 +35,7 @@ def get_photos_folder(root_folder):
 
 def get_script_name():
     script_name = os.path.splitext(os.path.basename(sys.argv[0]))[0]  # Use sys.argv[0] to get the main script name
-    logging.debug(f"Script name determined as: {script_name}")
+    logging.debug("Script name determined as: %s", script_name)
     return script_name
 
 def get_log_filename(log_dir):
@@ -38,5 +43,5 @@ def get_log_filename(log_dir):
     current_time = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
     log_filename = f"{script_name}_Log_{current_time}.log"
     log_full_path = os.path.join(log_dir, log_filename)
-    logging.debug(f"Log filename generated as: {log_full_path}")
+    logging.debug("Log filename generated as: %s", log_full_path)
     return log_full_path
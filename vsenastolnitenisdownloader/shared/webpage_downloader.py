@@ -1,43 +1,47 @@
 import os
 import logging
-import requests
+from shared.http_session import SESSION, REQUEST_TIMEOUT
 from shared.utils import sanitize_filename
 
 def download_webpage(url, filepath, overwrite=False, debug=False):
     try:
-        logging.debug(f"Starting download_webpage function for URL: {url}")
+        logging.debug("Starting download_webpage function for URL: %s", url)
 
         # Extract the directory and filename from the filepath
         directory, filename = os.path.split(filepath)
 
         # Sanitize the filename
         sanitized_filename = sanitize_filename(filename)
-        logging.debug(f"Original filename: {filename}, Sanitized filename: {sanitized_filename}")
+        logging.debug("Original filename: %s, Sanitized filename: %s", filename, sanitized_filename)
 
         # Reconstruct the sanitized filepath
         sanitized_filepath = os.path.join(directory, sanitized_filename)
-        logging.debug(f"Sanitized filepath: {sanitized_filepath}")
+        logging.debug("Sanitized filepath: %s", sanitized_filepath)
 
         # Check if file already exists
         if not overwrite and os.path.exists(sanitized_filepath):
-            logging.debug(f"File already exists and overwrite is not set: {sanitized_filepath}")
+            logging.debug("File already exists and overwrite is not set: %s", sanitized_filepath)
             return True
 
         # Download the webpage
-        logging.debug(f"Making HTTP request to URL: {url}")
-        response = requests.get(url)
-
-        if response.status_code == 404:
-            logging.debug(f"404 Not Found for URL: {url}")
-            return False
-        else:
-            response.raise_for_status()  # Raise an HTTPError for other bad responses
-
-        logging.debug(f"Downloading webpage from URL: {url} to filepath: {sanitized_filepath}")
-
-        # Write the content to a file
-        with open(sanitized_filepath, 'w', encoding='utf-8') as file:
-            file.write(response.text)
+        logging.debug("Making HTTP request to URL: %s", url)
+        with SESSION.get(url, stream=True, timeout=REQUEST_TIMEOUT) as response:
+            if response.status_code == 404:
+                logging.debug("404 Not Found for URL: %s", url)
+                return False
+            else:
+                response.raise_for_status()  # Raise an HTTPError for other bad responses
+
+            logging.debug("Downloading webpage from URL: %s to filepath: %s", url, sanitized_filepath)
+
+            # Write the body to a file as received, without decoding and re-encoding it.
+            # Stream into a .part file and move it into place only once the body is complete,
+            # so a dropped connection never leaves a truncated page that later runs would reuse.
+            temp_filepath = sanitized_filepath + '.part'
+            with open(temp_filepath, 'wb') as file:
+                for chunk in response.iter_content(chunk_size=64 * 1024):
+                    file.write(chunk)
+            os.replace(temp_filepath, sanitized_filepath)
 
         return True
 
@@ -1,6 +1,5 @@
 import logging
 from urllib.parse import urljoin
-from bs4 import BeautifulSoup
 from vsenastolnitenislib.constants import MAIN_URL
 from tqdm import tqdm 
 
@@ -29,7 +28,7 @@ def extract_category_links(main_page_html):
 
         # Return a sorted list of unique category links
         sorted_category_links = sorted(category_links)
-        logging.debug(f"Extracted category links: {sorted_category_links}")
+        logging.debug("Extracted category links: %s", sorted_category_links)
         return sorted_category_links
 
     except Exception as e:
@@ -1,16 +1,19 @@
 import logging
+from bs4 import SoupStrainer
 from urllib.parse import urljoin
-from bs4 import BeautifulSoup
 from vsenastolnitenislib.constants import MAIN_URL
 from tqdm import tqdm
 from shared.html_loader import load_html_as_dom_tree
 from vsenastolnitenislib.product_attribute_extractor import get_self_link
 
+# Pagination only needs the links (for 'konec') and the base element (for the self link)
+PAGINATION_STRAINER = SoupStrainer(['a', 'base'])
+
 def extract_all_category_pages_links(category_firstpage_paths):
     category_page_links = set()
     with tqdm(total=len(category_firstpage_paths), desc="Extracting all category page links") as pbar:
         for firstpage_path in category_firstpage_paths:
-            firstpage_dom = load_html_as_dom_tree(firstpage_path)
+            firstpage_dom = load_html_as_dom_tree(firstpage_path, parse_only=PAGINATION_STRAINER)
             category_page_links.update(extract_category_pages_links(firstpage_dom))
             pbar.update(1)
     logging.debug(category_page_links)
@@ -29,28 +32,25 @@ def extract_category_pages_links(category_page_dom):
         # If the "konec" element is found, extract the maximum limitstart value
         if konec_element:
             last_page_url = konec_element['href']
-            logging.debug(f"Found 'konec' element with relative URL: {last_page_url}")
-            last_limitstart = int(last_page_url.split('limitstart=')[-1])
+            logging.debug("Found 'konec' element with relative URL: %s", last_page_url)
+            # Everything up to and including the last "limitstart=" is the same for every page
+            limitstart_index = last_page_url.rfind('limitstart=') + len('limitstart=')
+            page_url_prefix = urljoin(MAIN_URL, last_page_url[:limitstart_index])
+            last_limitstart = int(last_page_url[limitstart_index:])
+
+            # Generate URLs for all pages from limitstart=0 to limitstart=last_limitstart with step of 20
+            page_links = {f"{page_url_prefix}{i}" for i in range(0, last_limitstart + 1, 20)}
+            logging.debug("Generated %s page URLs from prefix: %s", len(page_links), page_url_prefix)
         else:
-            last_limitstart = 0
             logging.debug("No 'konec' element found, setting last_limitstart to 0")
-
-        # Generate URLs for all pages from limitstart=0 to limitstart=last_limitstart with step of 20
-        for i in range(0, last_limitstart + 1, 20):
-            if konec_element:
-                page_url = last_page_url.replace(f"limitstart={last_limitstart}", f"limitstart={i}")
-                absolute_page_url = urljoin(MAIN_URL, page_url)
-                logging.debug(f"Generated page URL: {absolute_page_url}")
-                page_links.add(absolute_page_url)
-            else:
-                # If no "konec" element, generate the URL directly
-                page_url = f"{get_self_link(category_page_dom)}?limitstart=0"
-                logging.debug(f"Generated page URL without 'konec': {page_url}")
-                page_links.add(page_url)
+            # If no "konec" element, generate the URL directly
+            page_url = f"{get_self_link(category_page_dom)}?limitstart=0"
+            logging.debug("Generated page URL without 'konec': %s", page_url)
+            page_links.add(page_url)
 
         # Return the sorted set of unique URLs
         sorted_page_links = sorted(page_links)
-        logging.debug(f"Sorted unique page links: {sorted_page_links}")
+        logging.debug("Sorted unique page links: %s", sorted_page_links)
         return sorted_page_links
 
     except Exception as e:
@@ -4,27 +4,40 @@ import logging
 import re
 import itertools
 import ast
-from bs4 import BeautifulSoup
-from datetime import datetime
-from shared.image_downloader import download_image
-from shared.utils import sanitize_filename
+import json
+from bs4 import SoupStrainer
 from shared.html_loader import load_html_as_dom_tree
+from shared.process_pool import create_process_pool
 from tqdm import tqdm
 from vsenastolnitenislib.constants import MAIN_URL
 
+# Patterns used for every product page, compiled once at import
+HTML_TAG_PATTERN = re.compile('<[^<]+?>')
+JS_VARIANTS_SCRIPT_PATTERN = re.compile('var product_variants =')
+JS_VARIANTS_PATTERN = re.compile(r'var product_variants = (\[.*?\]);', re.DOTALL)
+JS_PROPERTY_NAME_PATTERN = re.compile(r'(\w+):')
+
+# Tags the product extractors look at; everything else on the page is skipped while parsing
+PRODUCT_PAGE_STRAINER = SoupStrainer(['base', 'h1', 'span', 'div', 'script', 'img', 'picture'])
+
 class Product:
+    __slots__ = ('name', 'short_description', 'description', 'variants', 'main_photo_link',
+                 'photogallery_links', 'main_photo_filepath', 'photogallery_filepaths', 'url')
+
     def __init__(self):
         self.name = ""
         self.short_description = ""
         self.description = ""
         self.variants = []
         self.main_photo_link = ""
-        self.photogallery_links = set()
+        self.photogallery_links = []
         self.main_photo_filepath = ""
         self.photogallery_filepaths = []
         self.url = ""
 
 class Variant:
+    __slots__ = ('key_value_pairs', 'current_price', 'basic_price', 'stock_status')
+
     def __init__(self, key_value_pairs, current_price, basic_price, stock_status):
         self.key_value_pairs = key_value_pairs
         self.current_price = current_price
@@ -38,7 +51,7 @@ def get_self_link(page_dom):
             base_url = base_element['href']
         else:
             base_url = MAIN_URL
-        logging.debug(f"Extracted base URL: {base_url}")
+        logging.debug("Extracted base URL: %s", base_url)
         return base_url
     except Exception as e:
         logging.error(f"Error extracting self link: {e}", exc_info=True)
@@ -49,7 +62,7 @@ def extract_product_name(dom_tree):
         h1_tag = dom_tree.find('h1', class_='pp-dash')
         if h1_tag:
             product_name = ''.join(h1_tag.stripped_strings)
-            product_name = re.sub('<[^<]+?>', '', product_name)  # Remove any HTML tags
+            product_name = HTML_TAG_PATTERN.sub('', product_name)  # Remove any HTML tags
             return product_name.strip()
         return ""
     except Exception as e:
@@ -78,16 +91,20 @@ def extract_product_description(dom_tree):
 
 def extract_product_js_variants(dom_tree):
     try:
-        script_tag = dom_tree.find('script', text=re.compile('var product_variants ='))
+        script_tag = dom_tree.find('script', text=JS_VARIANTS_SCRIPT_PATTERN)
         if script_tag:
             script_content = script_tag.string
-            json_text = re.search(r'var product_variants = (\[.*?\]);', script_content, re.DOTALL).group(1)
+            json_text = JS_VARIANTS_PATTERN.search(script_content).group(1)
             # Convert JavaScript array to JSON-compatible format
             json_text = json_text.replace("'", '"')  # Replace single quotes with double quotes
-            json_text = re.sub(r'(\w+):', r'"\1":', json_text)  # Ensure property names are quoted
-            # Use ast.literal_eval to safely evaluate the JSON-like structure
-            js_variants = ast.literal_eval(json_text)
-            logging.debug(f"Extracted JS variants: {js_variants}")
+            json_text = JS_PROPERTY_NAME_PATTERN.sub(r'"\1":', json_text)  # Ensure property names are quoted
+            # Parse with the C-backed json module; fall back to ast.literal_eval for
+            # JS literals JSON rejects, such as trailing commas
+            try:
+                js_variants = json.loads(json_text)
+            except json.JSONDecodeError:
+                js_variants = ast.literal_eval(json_text)
+            logging.debug("Extracted JS variants: %s", js_variants)
             return js_variants
         else:
             logging.debug("No JS variants found")
@@ -101,12 +118,12 @@ def extract_product_variants(dom_tree):
         variants = []
         key_value_pairs = []
         div_tags = dom_tree.find_all('div', class_='mb-2 pp-detail-options')
-        logging.debug(f"Found {len(div_tags)} div tags with class 'mb-2 pp-detail-options'")
+        logging.debug("Found %s div tags with class 'mb-2 pp-detail-options'", len(div_tags))
         variant_values = {}
-        all_input_tags = []
+        # (option name, label) -> input value id, so combinations can be resolved without rescanning the inputs
+        label_to_value_id = {}
         for div_tag in div_tags:
             input_tags = div_tag.find_all('input', type='radio')
-            all_input_tags.extend(input_tags)
             variant_single_vals = []
             for input_tag in input_tags:
                 parent = input_tag.find_parent()
@@ -116,46 +133,46 @@ def extract_product_variants(dom_tree):
                 if single_val['name'] not in variant_values:
                     variant_values[single_val['name']] = []
                 variant_values[single_val['name']].append(single_val['value'])
+                label_to_value_id[(single_val['name'], single_val['value'])] = single_val['value_id']
         keys = variant_values.keys()
         values = variant_values.values()
-        combinations = itertools.product(*values)
+        if len(variant_values) == 1:
+            # A single option group needs no Cartesian product: each label is one combination
+            combinations = [(value,) for value in next(iter(values))]
+        else:
+            combinations = itertools.product(*values)
         for combo in combinations:
             result_dict = dict(zip(keys, combo))
             key_value_pairs.append(result_dict)
-            logging.debug(f"Extracted key-value pair: {result_dict}")
+            logging.debug("Extracted key-value pair: %s", result_dict)
 
         # Extract JS variants data
         js_variants = extract_product_js_variants(dom_tree)
-        logging.debug(f"Extracted {len(js_variants)} JS variants")
+        logging.debug("Extracted %s JS variants", len(js_variants))
+        if not js_variants:
+            # Nothing to match against, so every combination gets the default price and stock
+            return [Variant(key_value_pair, 0, 0, '') for key_value_pair in key_value_pairs]
+
+        # Index JS variants by their value ids for the option names; setdefault keeps the
+        # first match, as the previous linear search did
+        option_names = list(keys)
+        js_variants_by_value_ids = {}
+        for js_variant in js_variants:
+            js_variants_by_value_ids.setdefault(tuple(js_variant.get(name.lower(), "") for name in option_names), js_variant)
 
         for key_value_pair in key_value_pairs:
-            keylist = list(key_value_pair.keys())
-            search_vals = []
-            for i in range(len(keylist)):
-                matches = []
-                for input in all_input_tags:
-                    if input['name'] == keylist[i]:
-                        parent = input.find_parent()
-                        if parent and parent.text.strip() == key_value_pair[keylist[i]]:
-                            matches.append({input['name']: input['value']})
-                search_vals.append(matches)
-            search_terms = list(itertools.chain.from_iterable(search_vals))
-            search_list = {}
-            for d in search_terms:
-                search_list.update(d)
-
-            logging.debug(f"Processing combination: {key_value_pair}")
-            pairkeys = search_list.keys()
+            logging.debug("Processing combination: %s", key_value_pair)
             # Find matching JS variant
-            matching_js_variant = next((js_variant for js_variant in js_variants if all(search_list[key] == js_variant.get(key.lower(), "") for key in pairkeys)), {})
-            logging.debug(f"Matching JS variant: {matching_js_variant}")
+            value_ids = tuple(label_to_value_id[(name, key_value_pair[name])] for name in option_names)
+            matching_js_variant = js_variants_by_value_ids.get(value_ids, {})
+            logging.debug("Matching JS variant: %s", matching_js_variant)
             current_price = matching_js_variant.get('price_raw', 0)
             basic_price = matching_js_variant.get('priceold_raw', current_price)
             stock_status = matching_js_variant.get('availability_txt', '')
             variant = Variant(key_value_pair, current_price, basic_price, stock_status)
             variants.append(variant)
 
-        logging.debug(f"Extracted HTML variants: {variants}")
+        logging.debug("Extracted HTML variants: %s", variants)
         return variants
     except Exception as e:
         logging.error(f"Error extracting product HTML variants: {e}", exc_info=True)
@@ -173,24 +190,25 @@ def extract_product_main_photo_link(dom_tree):
 
 def extract_product_photogallery_links(dom_tree):
     try:
-        photo_links = set()
+        photo_links = []
         picture_tags = dom_tree.find_all('picture')
         for picture in picture_tags:
             source_tag = picture.find('source')
             if source_tag and source_tag.has_attr('srcset'):
-                photo_links.add(MAIN_URL + source_tag['srcset'])
-        return photo_links
+                photo_links.append(MAIN_URL + source_tag['srcset'])
+        # Drop repeated pictures while keeping the order they appear on the page
+        return list(dict.fromkeys(photo_links))
     except Exception as e:
         logging.error(f"Error extracting product photogallery links: {e}", exc_info=True)
-        return set()
+        return []
 
 def extract_product(filepath):
     try:
         # Ensure the filepath is absolute
         filepath = os.path.abspath(filepath)
-        logging.debug(f"Extracting product from {filepath}")
+        logging.debug("Extracting product from %s", filepath)
 
-        dom_tree = load_html_as_dom_tree(filepath)
+        dom_tree = load_html_as_dom_tree(filepath, parse_only=PRODUCT_PAGE_STRAINER)
         product = Product()
         product.name = extract_product_name(dom_tree)
         product.short_description = extract_product_short_description(dom_tree)
@@ -208,10 +226,11 @@ def extract_product(filepath):
 
 def extract_products(product_detail_page_paths):
     products = []
-    with tqdm(total=len(product_detail_page_paths), desc="Extracting products") as pbar:
-        for product_detail_page_path in product_detail_page_paths:
-            product = extract_product(product_detail_page_path)
-            if product:
-                products.append(product)
-            pbar.update(1)
+    # Parsing is CPU-bound, so spread the pages over one worker process per core
+    with create_process_pool() as executor:
+        with tqdm(total=len(product_detail_page_paths), desc="Extracting products") as pbar:
+            for product in executor.map(extract_product, product_detail_page_paths, chunksize=16):
+                if product:
+                    products.append(product)
+                pbar.update(1)
     return products
\ No newline at end of file
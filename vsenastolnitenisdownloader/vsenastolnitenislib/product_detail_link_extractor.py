@@ -1,24 +1,30 @@
 import os
 import logging
-from bs4 import BeautifulSoup
+from bs4 import SoupStrainer
 from urllib.parse import urljoin
 from vsenastolnitenislib.constants import MAIN_URL
 from tqdm import tqdm
 from shared.html_loader import load_html_as_dom_tree
+from shared.process_pool import create_process_pool
+
+# Only links are needed from a category page; product cards are picked out of them below
+LINK_STRAINER = SoupStrainer('a')
 
 def extract_all_product_detail_links(category_pages_downloaded_paths):
     product_detail_links = set()
-    with tqdm(total=len(category_pages_downloaded_paths), desc="Extracting product detail links") as pbar:
-        for category_page_path in category_pages_downloaded_paths:
-            product_detail_links.update(extract_product_detail_links(category_page_path))
-            pbar.update(1)
+    # Parsing is CPU-bound, so spread the category pages over one worker process per core
+    with create_process_pool() as executor:
+        with tqdm(total=len(category_pages_downloaded_paths), desc="Extracting product detail links") as pbar:
+            for page_links in executor.map(extract_product_detail_links, category_pages_downloaded_paths, chunksize=8):
+                product_detail_links.update(page_links)
+                pbar.update(1)
     logging.debug(product_detail_links)
     return product_detail_links
 
 def extract_product_detail_links(category_page_filepath):
     try:
         # Load the HTML content of the category page
-        category_page_dom = load_html_as_dom_tree(category_page_filepath)
+        category_page_dom = load_html_as_dom_tree(category_page_filepath, parse_only=LINK_STRAINER)
         if category_page_dom is None:
             return set()
 
@@ -33,11 +39,11 @@ def extract_product_detail_links(category_page_filepath):
             relative_url = element.get('href')
             absolute_url = urljoin(MAIN_URL, relative_url)
             product_links.add(absolute_url)
-            logging.debug(f"Extracted product detail URL: {absolute_url}")
+            logging.debug("Extracted product detail URL: %s", absolute_url)
 
         # Return the sorted set of unique URLs
         sorted_product_links = sorted(product_links)
-        logging.debug(f"Sorted unique product detail links: {sorted_product_links}")
+        logging.debug("Sorted unique product detail links: %s", sorted_product_links)
         return sorted_product_links
 
     except Exception as e: